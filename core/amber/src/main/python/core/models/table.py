@@ -74,8 +74,11 @@ class Table(pandas.DataFrame):
         following their row index order.
         :return:
         """
+        # resolve the column names once instead of going through the
+        # DataFrame.columns property for every row.
+        columns = self.columns.tolist()
         for raw_tuple in self.itertuples(index=False, name=None):
-            yield Tuple(dict(zip(self.columns, raw_tuple)))
+            yield Tuple(dict(zip(columns, raw_tuple)))
 
     def __eq__(self, other: "Table") -> bool:
         if isinstance(other, Table):
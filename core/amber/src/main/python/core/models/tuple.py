@@ -18,7 +18,6 @@
 import ctypes
 import struct
 import typing
-from collections import OrderedDict
 from copy import deepcopy
 from typing import Any, List, Iterator, Callable
 
@@ -173,13 +172,14 @@ class Tuple:
             memory, or a callable accessor.
         """
         assert len(tuple_like) != 0
-        self._field_data: "OrderedDict[str, Field]"
+        # plain dicts keep insertion order, which is all the field order needs.
+        self._field_data: typing.Dict[str, Field]
         if isinstance(tuple_like, Tuple):
             self._field_data = tuple_like._field_data
         elif isinstance(tuple_like, pandas.Series):
-            self._field_data = OrderedDict(tuple_like.to_dict())
+            self._field_data = tuple_like.to_dict()
         else:
-            self._field_data = OrderedDict(tuple_like) if tuple_like else OrderedDict()
+            self._field_data = dict(tuple_like) if tuple_like else dict()
         self._schema: typing.Optional[Schema] = schema
 
     def __getitem__(self, item: typing.Union[int, str]) -> Field:
@@ -221,7 +221,7 @@ class Tuple:
         """Convert the tuple to Pandas series format"""
         return pandas.Series(self.as_dict())
 
-    def as_dict(self) -> "OrderedDict[str, Field]":
+    def as_dict(self) -> typing.Dict[str, Field]:
         """
         Return a dictionary copy of this tuple.
         Fields will be fetched from accessor if absent.
@@ -342,7 +342,7 @@ class Tuple:
         """
         assert self._schema is not None
         schema = self._schema.get_partial_schema(attribute_names)
-        new_raw_tuple = OrderedDict()
+        new_raw_tuple = dict()
         for name in attribute_names:
             new_raw_tuple[name] = self[name]
         return Tuple(new_raw_tuple, schema=schema)
@@ -16,6 +16,7 @@
 # under the License.
 
 import re
+from functools import lru_cache
 from typing import T
 
 from betterproto import Message, which_one_of
@@ -28,10 +29,15 @@ def get_one_of(base: T, sealed=True) -> T:
     return value
 
 
+@lru_cache(maxsize=None)
+def _to_snake_case_field_name(class_name: str) -> str:
+    # the set of message class names is small and fixed, so the conversion is
+    # done once per class instead of once per message.
+    return camel_case_pattern.sub("_", class_name.strip("V2")).lower()
+
+
 def set_one_of(base: T, value: Message) -> T:
-    name = value.__class__.__name__
-    name = name.strip("V2")
-    snake_case_name = re.sub(camel_case_pattern, "_", name).lower()
+    snake_case_name = _to_snake_case_field_name(value.__class__.__name__)
     ret = base()
     ret.__setattr__(snake_case_name, value)
     return ret